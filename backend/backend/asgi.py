@@ -19,7 +19,14 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings.production')
 # is populated before importing code that may import ORM models.
 django_asgi_app = get_asgi_application()
 
+# Build the URL resolver's reverse-lookup tables before the first request
+from django.urls import get_resolver
+get_resolver().reverse_dict
+
 from apps.notifications.routing import websocket_urlpatterns
+from backend.sentry_init import init_sentry
+
+init_sentry()
 
 application = ProtocolTypeRouter({
     "http": django_asgi_app,
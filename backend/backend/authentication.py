@@ -0,0 +1,50 @@
+"""
+API authentication for PrimePass project.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that remembers validated tokens in-process.
+
+    Clients send the same access token on every request until it expires, so
+    the decoded token is kept in a bounded LRU keyed by a hash of the raw
+    token and reused until its ``exp`` claim passes. Signature and claim
+    checks run once per token per worker instead of on every request.
+    """
+
+    cache_size = 4096
+
+    _cache = OrderedDict()
+    _lock = threading.Lock()
+
+    def get_validated_token(self, raw_token):
+        key = hashlib.blake2b(raw_token, digest_size=16).digest()
+        now = time.time()
+
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                validated_token, expires_at = entry
+                if expires_at > now:
+                    self._cache.move_to_end(key)
+                    return validated_token
+                del self._cache[key]
+
+        validated_token = super().get_validated_token(raw_token)
+        expires_at = validated_token.get('exp')
+        if expires_at is None:
+            return validated_token
+
+        with self._lock:
+            self._cache[key] = (validated_token, expires_at)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return validated_token
@@ -0,0 +1,28 @@
+"""
+Cache serializers for PrimePass project.
+
+Plugged into django-redis through CACHES['default']['OPTIONS']['SERIALIZER'].
+Values are serialized first and then handed to the configured compressor,
+so the write path is ``obj -> msgpack -> zstd -> Redis``.
+"""
+
+from typing import Any
+
+import msgpack
+from django.core.serializers.json import DjangoJSONEncoder
+from django_redis.serializers.base import BaseSerializer
+
+# Reuse Django's JSON encoder rules for types msgpack can't encode natively
+# (datetime, date, time, timedelta, Decimal, UUID, lazy strings), so cached
+# values decode exactly as they did with the JSON serializer.
+_encoder = DjangoJSONEncoder()
+
+
+class MSGPackSerializer(BaseSerializer):
+    """Serialize cache values with msgpack, falling back to Django's encoder."""
+
+    def dumps(self, value: Any) -> bytes:
+        return msgpack.packb(value, default=_encoder.default, use_bin_type=True)
+
+    def loads(self, value: bytes) -> Any:
+        return msgpack.unpackb(value, raw=False, strict_map_key=False)
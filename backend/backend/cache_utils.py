@@ -0,0 +1,63 @@
+"""
+Cache helpers for PrimePass project.
+
+``bulk_delete``/``bulk_hgetall`` batch commands against the default cache's
+Redis server into a single pipeline so bulk jobs (e.g. the scheduled cleanup
+tasks) pay one network round-trip instead of one per key. Keys are raw Redis
+keys; use ``cache.make_key()`` first when targeting values written through
+Django's cache API.
+
+``xfetch`` wraps Django's cache API with probabilistic early expiration.
+"""
+
+import math
+import random
+import time
+from typing import Any, Callable, Dict, Iterable, List
+
+from django.core.cache import caches
+from django_redis import get_redis_connection
+
+
+def bulk_delete(keys: Iterable[str], alias: str = 'default') -> int:
+    """Delete ``keys`` in one pipeline and return how many existed."""
+    client = get_redis_connection(alias)
+    pipe = client.pipeline(transaction=False)
+    for key in keys:
+        pipe.delete(key)
+    return sum(pipe.execute())
+
+
+def bulk_hgetall(keys: Iterable[str], alias: str = 'default') -> List[Dict[bytes, bytes]]:
+    """Fetch every hash in ``keys`` in one pipeline, preserving order."""
+    client = get_redis_connection(alias)
+    pipe = client.pipeline(transaction=False)
+    for key in keys:
+        pipe.hgetall(key)
+    return pipe.execute()
+
+
+def xfetch(key: str, recompute: Callable[[], Any], ttl: int, beta: float = 1.0,
+           alias: str = 'default') -> Any:
+    """
+    Return the cached value for ``key``, recomputing it with ``recompute()``.
+
+    Implements XFetch (probabilistic early expiration): each read may refresh
+    the value before it expires, with a probability that rises as expiry
+    nears and with how long the last recompute took. Hot keys are therefore
+    refreshed by one caller ahead of time instead of every worker missing at
+    once when the TTL runs out. ``beta`` > 1 favours earlier refreshes.
+    """
+    cache = caches[alias]
+    entry = cache.get(key)
+    if entry is not None:
+        value, delta, expiry = entry
+        # 1 - random() is in (0, 1], so the log is always defined
+        if time.time() - delta * beta * math.log(1.0 - random.random()) < expiry:
+            return value
+
+    start = time.time()
+    value = recompute()
+    now = time.time()
+    cache.set(key, (value, now - start, now + ttl), ttl)
+    return value
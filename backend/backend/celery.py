@@ -4,7 +4,7 @@ Celery configuration for PrimePass project.
 
 import os
 from celery import Celery
-from django.conf import settings
+from celery.signals import beat_init, worker_init, worker_process_init
 
 # Set the default Django settings module for the 'celery' program.
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings.development')
@@ -40,6 +40,18 @@ app.conf.beat_schedule = {
 
 app.conf.timezone = 'UTC'
 
+
+# worker_process_init covers prefork children; worker_init covers the solo and
+# threads pools, and beat_init the scheduler, which never fork.
+@worker_init.connect
+@worker_process_init.connect
+@beat_init.connect
+def init_worker_sentry(**kwargs):
+    from backend.sentry_init import init_sentry
+
+    init_sentry()
+
+
 @app.task(bind=True)
 def debug_task(self):
     print(f'Request: {self.request!r}')
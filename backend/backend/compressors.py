@@ -0,0 +1,36 @@
+"""
+Cache compressors for PrimePass project.
+
+Plugged into django-redis through CACHES['default']['OPTIONS']['COMPRESSOR'].
+"""
+
+import zstandard
+from django_redis.compressors.base import BaseCompressor
+from django_redis.exceptions import CompressorError
+
+# Payloads below this size are stored as-is; compressing them costs CPU and
+# usually makes them larger (e.g. small session blobs).
+MIN_COMPRESS_LEN = 256
+
+# Level 3 is zstd's default and gives most of the ratio at a fraction of the
+# CPU of higher levels.
+ZSTD_LEVEL = 3
+
+
+class ZstdCompressor(BaseCompressor):
+    """Compress cache values with zstd, skipping payloads that are too small."""
+
+    min_length = MIN_COMPRESS_LEN
+    level = ZSTD_LEVEL
+
+    def compress(self, value: bytes) -> bytes:
+        if len(value) >= self.min_length:
+            return zstandard.ZstdCompressor(level=self.level).compress(value)
+        return value
+
+    def decompress(self, value: bytes) -> bytes:
+        try:
+            return zstandard.ZstdDecompressor().decompress(value)
+        except zstandard.ZstdError as e:
+            # django-redis treats CompressorError as "value was not compressed"
+            raise CompressorError from e
@@ -0,0 +1,26 @@
+"""
+Jinja2 environment for PrimePass project.
+
+Referenced from the Jinja2 entry in TEMPLATES. Loop-heavy templates such as
+notification emails live under ``jinja2/`` and render through this engine;
+the admin and other Django templates stay on the Django engine.
+"""
+
+from django.templatetags.static import static
+from django.urls import reverse
+from jinja2 import Environment, FileSystemBytecodeCache
+
+
+def environment(**options):
+    """Build the Jinja2 environment with an on-disk bytecode cache."""
+    if 'bytecode_cache' not in options:
+        # No directory given: Jinja2 creates a per-user 0o700 directory under
+        # the temp dir, so other local users can't plant compiled templates.
+        options['bytecode_cache'] = FileSystemBytecodeCache()
+
+    env = Environment(**options)
+    env.globals.update({
+        'static': static,
+        'url': reverse,
+    })
+    return env
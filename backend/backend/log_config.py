@@ -0,0 +1,67 @@
+"""
+Logging setup for PrimePass project.
+
+Used as LOGGING_CONFIG in production so that blocking handlers (file,
+console) run on a background QueueListener thread and request threads only
+enqueue records.
+"""
+
+import atexit
+import logging.config
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+# (QueueHandler, target handlers) pairs from the last configure_logging call,
+# and the listeners draining them in this process.
+_queues = []
+_listeners = []
+
+
+def _start_listeners():
+    for handler, targets in _queues:
+        listener = QueueListener(handler.queue, *targets, respect_handler_level=True)
+        listener.start()
+        _listeners.append(listener)
+
+
+@atexit.register
+def _stop_listeners():
+    while _listeners:
+        _listeners.pop().stop()
+
+
+def _restart_in_child():
+    # The parent's listener threads don't exist here and the inherited
+    # queues' locks may have been held by them at fork time: forget the old
+    # listeners without stopping them and drain fresh queues instead.
+    _listeners.clear()
+    for handler, _targets in _queues:
+        handler.queue = queue.Queue(-1)
+    _start_listeners()
+
+
+os.register_at_fork(after_in_child=_restart_in_child)
+
+
+def configure_logging(logging_settings):
+    """
+    Apply ``logging_settings`` with dictConfig, then start a QueueListener for
+    every QueueHandler it defines.
+
+    A queue handler names the handlers its listener drains into with a
+    ``'.': {'targets': [...]}`` entry. Listener threads do not survive fork
+    (gunicorn and Celery prefork workers), so each child process gets a fresh
+    queue and listener of its own.
+    """
+    configurator = logging.config.DictConfigurator(logging_settings)
+    configurator.configure()
+
+    handlers = configurator.config.get('handlers', {})
+    _stop_listeners()
+    _queues[:] = [
+        (handler, [handlers[name] for name in getattr(handler, 'targets', ())])
+        for handler in handlers.values()
+        if isinstance(handler, QueueHandler)
+    ]
+    _start_listeners()
@@ -0,0 +1,26 @@
+"""
+API parsers for PrimePass project.
+"""
+
+import orjson
+from django.conf import settings
+from djangorestframework_camel_case.parser import CamelCaseJSONParser
+from djangorestframework_camel_case.settings import api_settings
+from djangorestframework_camel_case.util import underscoreize
+from rest_framework.exceptions import ParseError
+
+
+class OrjsonCamelCaseJSONParser(CamelCaseJSONParser):
+    """CamelCaseJSONParser equivalent that decodes with orjson."""
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+
+        try:
+            data = stream.read()
+            if encoding.lower().replace('-', '') != 'utf8':
+                data = data.decode(encoding)
+            return underscoreize(orjson.loads(data), **api_settings.JSON_UNDERSCOREIZE)
+        except ValueError as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
@@ -0,0 +1,106 @@
+"""
+Redis rate limiting for PrimePass project.
+
+A fixed-window counter evaluated as a Lua script, so each check costs one
+round-trip (INCR + EXPIRE run atomically inside Redis) instead of the
+get/incr/set sequence of cache-based limiters. Uses the cache's connection
+pool and key prefix/version. Client IPs are read from
+``RATELIMIT_IP_META_KEY`` (as django-ratelimit does) so limits apply per
+client rather than to the reverse proxy.
+
+Usage::
+
+    @ratelimit(key='ip', rate='10/m')
+    def view(request): ...
+"""
+
+from functools import lru_cache, wraps
+
+from django.conf import settings
+from django.core.cache import caches
+from django_ratelimit.exceptions import Ratelimited
+from django_redis import get_redis_connection
+
+_INCR_SCRIPT = """
+local n = redis.call('INCR', KEYS[1])
+if n == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return n
+"""
+
+_PERIODS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+
+@lru_cache(maxsize=None)
+def _incr_script(alias):
+    return get_redis_connection(alias).register_script(_INCR_SCRIPT)
+
+
+def parse_rate(rate):
+    """Parse ``'<count>/<s|m|h|d>'`` into ``(count, period_seconds)``."""
+    count, period = rate.split('/')
+    return int(count), _PERIODS[period.lower()[0]]
+
+
+def client_ip(request):
+    """
+    Return the client address according to ``RATELIMIT_IP_META_KEY``.
+
+    Unset means ``REMOTE_ADDR``. For ``X-Forwarded-For`` the right-most entry
+    is used: it is the one our own proxy appended, the others are
+    client-supplied.
+    """
+    meta_key = getattr(settings, 'RATELIMIT_IP_META_KEY', None)
+    if callable(meta_key):
+        return meta_key(request)
+    value = request.META.get(meta_key or 'REMOTE_ADDR', '')
+    if meta_key == 'HTTP_X_FORWARDED_FOR':
+        value = value.split(',')[-1].strip()
+    return value or request.META.get('REMOTE_ADDR', '')
+
+
+def _client_key(request, key):
+    if callable(key):
+        return key(request)
+    if key == 'ip':
+        return client_ip(request)
+    if key == 'user':
+        user = getattr(request, 'user', None)
+        if user is not None and user.is_authenticated:
+            return str(user.pk)
+        return client_ip(request)
+    raise ValueError(f'Unknown rate limit key: {key!r}')
+
+
+def is_ratelimited(group, value, rate, alias='default'):
+    """Count a hit for ``value`` in ``group`` and report whether it is over ``rate``."""
+    limit, period = parse_rate(rate)
+    redis_key = caches[alias].make_key(f'rl:{group}:{value}')
+    count = _incr_script(alias)(keys=[redis_key], args=[period])
+    return count > limit
+
+
+def ratelimit(key='ip', rate='100/m', group=None, block=True):
+    """
+    Limit a view to ``rate`` requests per client.
+
+    ``key`` is ``'ip'``, ``'user'`` or a callable taking the request. When
+    ``block`` is False the view runs anyway and ``request.limited`` is set.
+    """
+    def decorator(view):
+        view_group = group or f'{view.__module__}.{view.__qualname__}'
+
+        @wraps(view)
+        def wrapped(request, *args, **kwargs):
+            limited = False
+            if getattr(settings, 'RATELIMIT_ENABLE', True):
+                limited = is_ratelimited(view_group, _client_key(request, key), rate)
+            request.limited = limited
+            if limited and block:
+                raise Ratelimited()
+            return view(request, *args, **kwargs)
+
+        return wrapped
+
+    return decorator
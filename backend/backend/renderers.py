@@ -0,0 +1,34 @@
+"""
+API renderers for PrimePass project.
+"""
+
+import orjson
+from djangorestframework_camel_case.settings import api_settings
+from djangorestframework_camel_case.util import camelize
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# DRF's encoder covers the types orjson doesn't handle natively
+# (Decimal, lazy translation strings, querysets, ...).
+_encoder = JSONEncoder()
+
+
+class OrjsonCamelCaseRenderer(JSONRenderer):
+    """CamelCaseJSONRenderer equivalent that serializes with orjson."""
+
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        options = self.options
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context):
+            options |= orjson.OPT_INDENT_2
+
+        return orjson.dumps(
+            camelize(data, **api_settings.JSON_UNDERSCOREIZE),
+            default=_encoder.default,
+            option=options,
+        )
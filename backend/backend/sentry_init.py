@@ -0,0 +1,42 @@
+"""
+Sentry initialisation for PrimePass project.
+
+Called once per worker process after fork (gunicorn ``post_worker_init``,
+Celery ``worker_process_init``; ``worker_init``/``beat_init`` for the solo and
+threads pools and beat) instead of at settings import, so each worker starts
+its own transport thread rather than inheriting a dead one from the master.
+The ASGI entry point and ``manage.py`` call it directly.
+"""
+
+import sentry_sdk
+from django.conf import settings
+from sentry_sdk.integrations.celery import CeleryIntegration
+from sentry_sdk.integrations.django import DjangoIntegration
+from sentry_sdk.integrations.redis import RedisIntegration
+
+
+def init_sentry():
+    """Initialise the Sentry SDK if SENTRY_DSN is configured."""
+    dsn = getattr(settings, 'SENTRY_DSN', '')
+    if not dsn:
+        return
+
+    sentry_sdk.init(
+        dsn=dsn,
+        integrations=[
+            DjangoIntegration(
+                transaction_style='url',
+                middleware_spans=True,
+                signals_spans=True,
+            ),
+            CeleryIntegration(
+                monitor_beat_tasks=True,
+                propagate_traces=True,
+            ),
+            RedisIntegration(),
+        ],
+        traces_sample_rate=settings.SENTRY_TRACES_SAMPLE_RATE,
+        send_default_pii=False,
+        environment=settings.SENTRY_ENVIRONMENT,
+        release=settings.SENTRY_RELEASE,
+    )
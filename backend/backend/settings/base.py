@@ -5,14 +5,36 @@ This file contains settings that are common to all environments.
 For environment-specific settings, see development.py and production.py.
 """
 
+import logging
 import os
 from pathlib import Path
-from decouple import config
+from urllib.parse import urlsplit
+from decouple import Config, RepositoryEmpty, RepositoryEnv
 from datetime import timedelta
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 
+# Resolve the .env file once (backend/.env, then the repository root) rather
+# than letting decouple's AutoConfig search for it. Environment variables
+# still take precedence over the file.
+_env_file = next(
+    (path for path in (BASE_DIR / '.env', BASE_DIR.parent / '.env') if path.is_file()),
+    None,
+)
+config = Config(RepositoryEnv(str(_env_file)) if _env_file else RepositoryEmpty())
+
+
+def _csv(value):
+    """Cast a comma-separated env var to a list, dropping empty entries."""
+    return [s.strip() for s in value.split(',') if s.strip()]
+
+
+# Read once; shared by several settings below
+REDIS_URL = config('REDIS_URL', default='redis://localhost:6379/0')
+LOG_LEVEL = config('LOG_LEVEL', default='INFO')
+
+
 # ==============================================================================
 # CORE DJANGO SETTINGS
 # ==============================================================================
@@ -23,7 +45,7 @@ SECRET_KEY = config('SECRET_KEY', default='your-super-secret-key-change-this-in-
 # SECURITY WARNING: don't run with debug turned on in production!
 DEBUG = config('DEBUG', default=False, cast=bool)
 
-ALLOWED_HOSTS = config('ALLOWED_HOSTS', default='localhost,127.0.0.1', cast=lambda v: [s.strip() for s in v.split(',')])
+ALLOWED_HOSTS = config('ALLOWED_HOSTS', default='localhost,127.0.0.1', cast=_csv)
 
 # Application definition
 DJANGO_APPS = [
@@ -56,7 +78,7 @@ THIRD_PARTY_APPS = [
     'django_countries',
     
     # Caching
-    'cachalot',
+    'cacheops',
     
     # Real-time
     'channels',
@@ -112,6 +134,17 @@ TEMPLATES = [
             ],
         },
     },
+    # Compiled engine for loop-heavy templates (notifications, emails)
+    {
+        'BACKEND': 'django.template.backends.jinja2.Jinja2',
+        'DIRS': [BASE_DIR / 'jinja2'],
+        'APP_DIRS': True,
+        'OPTIONS': {
+            'environment': 'backend.jinja2.environment',
+            'auto_reload': False,
+            'cache_size': 400,
+        },
+    },
 ]
 
 WSGI_APPLICATION = 'backend.wsgi.application'
@@ -129,8 +162,18 @@ DATABASES = {
         'PASSWORD': config('DATABASE_PASSWORD', default='primepass_password'),
         'HOST': config('DATABASE_HOST', default='localhost'),
         'PORT': config('DATABASE_PORT', default='5432'),
+        # Validate persistent connections once per request cycle instead of
+        # failing the first query on a dropped connection.
+        'CONN_HEALTH_CHECKS': True,
         'OPTIONS': {
             'connect_timeout': 10,
+            # psycopg 3: bind parameters server-side and PREPARE a query once it
+            # has run this many times on a connection, so Postgres skips
+            # re-parsing/planning it. Binding is only worth its quirks (e.g. no
+            # parameters in DDL) when statements get prepared, so the PgBouncer
+            # overrides turn both off together.
+            'server_side_binding': True,
+            'prepare_threshold': 5,
         },
     }
 }
@@ -142,24 +185,54 @@ DATABASES = {
 CACHES = {
     'default': {
         'BACKEND': 'django_redis.cache.RedisCache',
-        'LOCATION': config('REDIS_URL', default='redis://localhost:6379/0'),
+        'LOCATION': REDIS_URL,
         'OPTIONS': {
             'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+            # Parse RESP replies in C (requires the hiredis package)
+            'PARSER_CLASS': 'redis.connection._HiredisParser',
+            # Blocking pool: when all connections are busy, callers wait up to
+            # `timeout` seconds for one instead of opening more and failing
+            # with "Too many connections".
+            'CONNECTION_POOL_CLASS': 'redis.BlockingConnectionPool',
             'CONNECTION_POOL_KWARGS': {
-                'max_connections': 50,
+                'max_connections': config('REDIS_MAX_CONNECTIONS', default=20, cast=int),
+                'timeout': config('DJANGO_CACHE_BLOCKING_TIMEOUT', default=2.0, cast=float),
+                'socket_timeout': 2,
+                'socket_connect_timeout': 2,
+                'socket_keepalive': True,
                 'retry_on_timeout': True,
             },
-            'SERIALIZER': 'django_redis.serializers.json.JSONSerializer',
-            'COMPRESSOR': 'django_redis.compressors.zlib.ZlibCompressor',
+            'SERIALIZER': 'backend.cache_serializers.MSGPackSerializer',
+            'COMPRESSOR': 'backend.compressors.ZstdCompressor',
         },
         'KEY_PREFIX': 'primepass',
+        # Bumped with the zstd+msgpack wire format so entries written in the
+        # old zlib+JSON format are never read back (they'd fail to decode).
+        'VERSION': 2,
         'TIMEOUT': config('CACHE_TTL', default=3600, cast=int),
     }
 }
 
+# Query caching: only the hot querysets below are cached, with per-model
+# invalidation, instead of every ORM read (as cachalot did).
+CACHALOT_ENABLED = False
+# Own Redis DB: `manage.py invalidate all` runs FLUSHDB, which must not take
+# the cache and the Celery broker (DB 0) with it.
+CACHEOPS_REDIS = config(
+    'CACHEOPS_REDIS_URL', default=urlsplit(REDIS_URL)._replace(path='/1').geturl()
+)
+CACHEOPS_DEFAULTS = {
+    'timeout': 60 * 15,
+}
+CACHEOPS = {
+    'events.event': {'ops': 'get'},
+    'analytics.*': {'ops': ('fetch', 'count')},
+}
+
 # Session configuration
-SESSION_ENGINE = 'django.contrib.sessions.backends.cache'
-SESSION_CACHE_ALIAS = 'default'
+# API traffic authenticates with JWT, so sessions are small and mostly used by
+# the admin; keeping them in a signed cookie avoids a Redis read per request.
+SESSION_ENGINE = 'django.contrib.sessions.backends.signed_cookies'
 SESSION_COOKIE_AGE = config('SESSION_CACHE_TTL', default=86400, cast=int)
 
 # ==============================================================================
@@ -187,20 +260,19 @@ ACCOUNT_EMAIL_VERIFICATION = 'mandatory'
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'backend.authentication.CachedJWTAuthentication',
         'rest_framework.authentication.SessionAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
     'DEFAULT_RENDERER_CLASSES': [
-        'djangorestframework_camel_case.render.CamelCaseJSONRenderer',
-        'rest_framework.renderers.JSONRenderer',
+        'backend.renderers.OrjsonCamelCaseRenderer',
     ],
     'DEFAULT_PARSER_CLASSES': [
         'djangorestframework_camel_case.parser.CamelCaseFormParser',
         'djangorestframework_camel_case.parser.CamelCaseMultiPartParser',
-        'djangorestframework_camel_case.parser.CamelCaseJSONParser',
+        'backend.parsers.OrjsonCamelCaseJSONParser',
     ],
     'DEFAULT_FILTER_BACKENDS': [
         'django_filters.rest_framework.DjangoFilterBackend',
@@ -221,7 +293,8 @@ SIMPLE_JWT = {
     'UPDATE_LAST_LOGIN': True,
     'ALGORITHM': config('JWT_ALGORITHM', default='HS256'),
     'SIGNING_KEY': config('JWT_SECRET_KEY', default=SECRET_KEY),
-    'VERIFYING_KEY': None,
+    # Public key for asymmetric algorithms (e.g. RS256); unused with HS256
+    'VERIFYING_KEY': config('JWT_VERIFYING_KEY', default=None),
     'AUDIENCE': None,
     'ISSUER': None,
     'AUTH_HEADER_TYPES': ('Bearer',),
@@ -240,7 +313,7 @@ SIMPLE_JWT = {
 CORS_ALLOWED_ORIGINS = config(
     'CORS_ALLOWED_ORIGINS',
     default='http://localhost:3000,http://127.0.0.1:3000',
-    cast=lambda v: [s.strip() for s in v.split(',')]
+    cast=_csv
 )
 
 CORS_ALLOW_CREDENTIALS = config('CORS_ALLOW_CREDENTIALS', default=True, cast=bool)
@@ -250,13 +323,15 @@ CORS_ALLOW_ALL_ORIGINS = config('CORS_ALLOW_ALL_ORIGINS', default=False, cast=bo
 # CHANNELS CONFIGURATION (WebSockets)
 # ==============================================================================
 
+# The pub/sub layer keeps one SUBSCRIBE connection per worker instead of
+# polling with BRPOP per message. Messages are fire-and-forget: there is no
+# per-channel buffer (capacity/expiry don't apply) and group fan-out is not
+# guaranteed to be delivered in order or at all to disconnected consumers.
 CHANNEL_LAYERS = {
     'default': {
-        'BACKEND': 'channels_redis.core.RedisChannelLayer',
+        'BACKEND': 'channels_redis.pubsub.RedisPubSubChannelLayer',
         'CONFIG': {
-            'hosts': [config('REDIS_URL', default='redis://localhost:6379/0')],
-            'capacity': 1500,
-            'expiry': 10,
+            'hosts': [REDIS_URL],
         },
     },
 }
@@ -265,14 +340,36 @@ CHANNEL_LAYERS = {
 # CELERY CONFIGURATION
 # ==============================================================================
 
-CELERY_BROKER_URL = config('REDIS_URL', default='redis://localhost:6379/0')
-CELERY_RESULT_BACKEND = config('REDIS_URL', default='redis://localhost:6379/0')
+CELERY_BROKER_URL = REDIS_URL
+CELERY_RESULT_BACKEND = REDIS_URL
 CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = 'UTC'
 CELERY_BEAT_SCHEDULER = 'django_celery_beat.schedulers:DatabaseScheduler'
 
+# Short, latency-sensitive tasks (event reminders) get their own queue so long
+# cleanups can't hold them up; run one worker per queue (-Q realtime / -Q bulk).
+CELERY_TASK_ROUTES = {
+    'apps.events.tasks.*': {'queue': 'realtime'},
+    'apps.notifications.tasks.*': {'queue': 'bulk'},
+    'apps.analytics.tasks.*': {'queue': 'bulk'},
+}
+# Unrouted tasks (backend.celery.debug_task, beat entries) go to the bulk
+# worker instead of the unconsumed 'celery' queue.
+CELERY_TASK_DEFAULT_QUEUE = 'bulk'
+# Default for workers started without --prefetch-multiplier. The bulk worker
+# runs short I/O-bound tasks and overrides this (e.g. 4) to amortise broker
+# round-trips; the realtime worker keeps 1 for fair dispatch.
+CELERY_WORKER_PREFETCH_MULTIPLIER = config('CELERY_PREFETCH', default=1, cast=int)
+CELERY_TASK_ACKS_LATE = True
+CELERY_BROKER_TRANSPORT_OPTIONS = {
+    'visibility_timeout': 3600,
+    'global_keyprefix': 'pp:',
+    'socket_keepalive': True,
+    'health_check_interval': 30,
+}
+
 # ==============================================================================
 # INTERNATIONALIZATION
 # ==============================================================================
@@ -296,7 +393,12 @@ MEDIA_URL = config('MEDIA_URL', default='/media/')
 MEDIA_ROOT = BASE_DIR / 'media'
 
 # WhiteNoise configuration
-STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+# Compression is normally left to nginx/the CDN; set WHITENOISE_COMPRESS when
+# Django serves static files itself and precompressed copies are wanted.
+if config('WHITENOISE_COMPRESS', default=False, cast=bool):
+    STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+else:
+    STATICFILES_STORAGE = 'django.contrib.staticfiles.storage.ManifestStaticFilesStorage'
 
 # ==============================================================================
 # SECURITY SETTINGS
@@ -311,6 +413,10 @@ X_FRAME_OPTIONS = config('X_FRAME_OPTIONS', default='DENY')
 AXES_FAILURE_LIMIT = 5
 AXES_COOLOFF_TIME = 1  # 1 hour
 AXES_LOCK_OUT_BY_COMBINATION_USER_AND_IP = True
+# Track failed attempts in Redis instead of writing to the database
+AXES_HANDLER = 'axes.handlers.cache.AxesCacheHandler'
+AXES_CACHE = 'default'
+AXES_RESET_ON_SUCCESS = True
 
 # ==============================================================================
 # LOGGING CONFIGURATION
@@ -330,31 +436,40 @@ LOGGING = {
         },
     },
     'handlers': {
+        # Buffer records and write them to `file_target` in batches; ERROR and
+        # above flush the buffer immediately.
         'file': {
-            'level': config('LOG_LEVEL', default='INFO'),
+            'level': LOG_LEVEL,
+            'class': 'logging.handlers.MemoryHandler',
+            'capacity': 200,
+            'flushLevel': logging.ERROR,
+            'target': 'file_target',
+        },
+        'file_target': {
+            'level': LOG_LEVEL,
             'class': 'logging.FileHandler',
             'filename': config('LOG_FILE', default='logs/primepass.log'),
             'formatter': 'verbose',
         },
         'console': {
-            'level': config('LOG_LEVEL', default='INFO'),
+            'level': LOG_LEVEL,
             'class': 'logging.StreamHandler',
             'formatter': 'simple',
         },
     },
     'root': {
         'handlers': ['console', 'file'],
-        'level': config('LOG_LEVEL', default='INFO'),
+        'level': LOG_LEVEL,
     },
     'loggers': {
         'django': {
             'handlers': ['console', 'file'],
-            'level': config('LOG_LEVEL', default='INFO'),
+            'level': LOG_LEVEL,
             'propagate': False,
         },
         'primepass': {
             'handlers': ['console', 'file'],
-            'level': config('LOG_LEVEL', default='INFO'),
+            'level': LOG_LEVEL,
             'propagate': False,
         },
     },
@@ -371,8 +486,13 @@ SPECTACULAR_SETTINGS = {
     'SERVE_INCLUDE_SCHEMA': False,
     'COMPONENT_SPLIT_REQUEST': True,
     'SCHEMA_PATH_PREFIX': '/api/v1/',
+    'SERVE_PUBLIC': True,
 }
 
+# Schema baked at deploy time; served as-is instead of regenerating per request
+# when DEBUG is off and the file exists.
+SPECTACULAR_SCHEMA_FILE = config('SPECTACULAR_SCHEMA_FILE', default=str(BASE_DIR / 'schema.json'))
+
 # ==============================================================================
 # DEFAULT PRIMARY KEY FIELD TYPE
 # ==============================================================================
@@ -400,6 +520,10 @@ FRONTEND_URL = config('FRONTEND_URL', default='http://localhost:3000')
 # API Configuration
 API_VERSION = config('API_VERSION', default='v1')
 
+# Admin
+ADMIN_URL = config('ADMIN_URL', default='admin/')
+ENABLE_ADMIN = config('ENABLE_ADMIN', default=True, cast=bool)
+
 # Event Management
 MAX_EVENTS_PER_USER = config('MAX_EVENTS_PER_USER', default=10, cast=int)
 MAX_ATTENDEES_PER_EVENT = config('MAX_ATTENDEES_PER_EVENT', default=1000, cast=int)
@@ -407,5 +531,5 @@ DEFAULT_EVENT_DURATION = config('DEFAULT_EVENT_DURATION', default=3600, cast=int
 
 # Notifications
 ENABLE_NOTIFICATIONS = config('ENABLE_NOTIFICATIONS', default=True, cast=bool)
-NOTIFICATION_CHANNELS = config('NOTIFICATION_CHANNELS', default='email,websocket', cast=lambda v: [s.strip() for s in v.split(',')])
+NOTIFICATION_CHANNELS = config('NOTIFICATION_CHANNELS', default='email,websocket', cast=_csv)
 WEBSOCKET_URL = config('WEBSOCKET_URL', default='ws://localhost:8000/ws/')
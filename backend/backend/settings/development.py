@@ -20,18 +20,28 @@ ALLOWED_HOSTS = ['localhost', '127.0.0.1', '0.0.0.0', 'backend']
 
 INSTALLED_APPS += [
     'django_extensions',
-    'debug_toolbar',
-    'silk',
 ]
 
+# Profilers are opt-in: both instrument every request (silk also writes each
+# request and query to the database), which slows down ordinary local use.
+ENABLE_DEBUG_TOOLBAR = config('ENABLE_DEBUG_TOOLBAR', default=False, cast=bool)
+ENABLE_SILK = config('ENABLE_SILK', default=False, cast=bool)
+
+if ENABLE_DEBUG_TOOLBAR:
+    INSTALLED_APPS += ['debug_toolbar']
+
+if ENABLE_SILK:
+    INSTALLED_APPS += ['silk']
+
 # ==============================================================================
 # DEVELOPMENT MIDDLEWARE
 # ==============================================================================
 
-MIDDLEWARE = [
-    'debug_toolbar.middleware.DebugToolbarMiddleware',
-    'silk.middleware.SilkyMiddleware',
-] + MIDDLEWARE
+if ENABLE_SILK:
+    MIDDLEWARE = ['silk.middleware.SilkyMiddleware'] + MIDDLEWARE
+
+if ENABLE_DEBUG_TOOLBAR:
+    MIDDLEWARE = ['debug_toolbar.middleware.DebugToolbarMiddleware'] + MIDDLEWARE
 
 # ==============================================================================
 # DEBUG TOOLBAR CONFIGURATION
@@ -61,16 +71,25 @@ SILKY_AUTHORISATION = True
 # ==============================================================================
 
 # Use PgBouncer in development for testing
-if config('USE_PGBOUNCER', default=False, cast=bool):
+USE_PGBOUNCER = config('USE_PGBOUNCER', default=False, cast=bool)
+if USE_PGBOUNCER:
     DATABASES['default']['HOST'] = config('DATABASE_HOST', default='pgbouncer')
     DATABASES['default']['PORT'] = config('PGBOUNCER_PORT', default='5432')
 
 # Docker environment detection - use pgbouncer if running in Docker
 import os
 if os.path.exists('/.dockerenv') or config('DOCKER_ENV', default=False, cast=bool):
+    USE_PGBOUNCER = True
     DATABASES['default']['HOST'] = 'pgbouncer'
     DATABASES['default']['PORT'] = '6432'  # pgbouncer actually listens on 6432
 
+# PgBouncer's transaction pooling can't track server-side prepared statements
+if USE_PGBOUNCER:
+    DATABASES['default']['OPTIONS'].update({
+        'server_side_binding': False,
+        'prepare_threshold': None,
+    })
+
 # ==============================================================================
 # CACHE CONFIGURATION
 # ==============================================================================
@@ -103,11 +122,14 @@ CORS_ALLOWED_ORIGINS = [
 # ==============================================================================
 
 LOGGING['handlers']['console']['level'] = 'DEBUG'
-LOGGING['loggers']['django.db.backends'] = {
-    'handlers': ['console'],
-    'level': 'DEBUG',
-    'propagate': False,
-}
+
+# Formatting every SQL statement is costly; only log queries on request
+if config('LOG_SQL', default=False, cast=bool):
+    LOGGING['loggers']['django.db.backends'] = {
+        'handlers': ['console'],
+        'level': 'DEBUG',
+        'propagate': False,
+    }
 
 # ==============================================================================
 # DEVELOPMENT UTILITIES
@@ -159,6 +181,7 @@ QUERYCOUNT = {
 
 # Disable template caching
 TEMPLATES[0]['OPTIONS']['debug'] = True
+TEMPLATES[1]['OPTIONS']['auto_reload'] = True
 if 'loaders' in TEMPLATES[0]['OPTIONS']:
     TEMPLATES[0]['OPTIONS']['loaders'] = [
         'django.template.loaders.filesystem.Loader',
@@ -192,6 +215,7 @@ if 'test' in sys.argv or 'pytest' in sys.modules:
             'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
         }
     }
+    CACHEOPS_ENABLED = False
     
     # Disable Celery in tests
     CELERY_TASK_ALWAYS_EAGER = True
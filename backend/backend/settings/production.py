@@ -4,18 +4,16 @@ Production settings for PrimePass project.
 This file contains settings specific to the production environment.
 """
 
+import queue
 from .base import *
-import sentry_sdk
-from sentry_sdk.integrations.django import DjangoIntegration
-from sentry_sdk.integrations.celery import CeleryIntegration
-from sentry_sdk.integrations.redis import RedisIntegration
+from .base import _csv
 
 # ==============================================================================
 # SECURITY SETTINGS
 # ==============================================================================
 
 DEBUG = False
-ALLOWED_HOSTS = config('ALLOWED_HOSTS', cast=lambda v: [s.strip() for s in v.split(',')])
+ALLOWED_HOSTS = config('ALLOWED_HOSTS', cast=_csv)
 
 # Security headers
 SECURE_SSL_REDIRECT = config('SECURE_SSL_REDIRECT', default=True, cast=bool)
@@ -42,14 +40,24 @@ CSRF_COOKIE_SAMESITE = 'Lax'
 # Use PgBouncer in production
 DATABASES['default']['HOST'] = config('DATABASE_HOST')
 DATABASES['default']['PORT'] = config('PGBOUNCER_PORT', default='6432')
+# Transaction isolation is left to PgBouncer/Postgres (read committed is the
+# server default) so no startup options are re-sent on every connection.
 DATABASES['default']['OPTIONS'].update({
     'sslmode': 'require',
     'connect_timeout': 10,
-    'options': '-c default_transaction_isolation=read_committed'
 })
 
 # Connection pooling
-DATABASES['default']['CONN_MAX_AGE'] = 60
+DATABASES['default']['CONN_MAX_AGE'] = config('DJANGO_MAX_CONN_AGE', default=600, cast=int)
+# Server-side cursors don't survive PgBouncer's transaction pooling mode
+DATABASES['default']['DISABLE_SERVER_SIDE_CURSORS'] = True
+# Likewise for server-side prepared statements, unless PgBouncer is 1.21+
+# with max_prepared_statements enabled
+if not config('PGBOUNCER_PREPARED_STATEMENTS', default=False, cast=bool):
+    DATABASES['default']['OPTIONS'].update({
+        'server_side_binding': False,
+        'prepare_threshold': None,
+    })
 
 # ==============================================================================
 # CACHE CONFIGURATION
@@ -57,8 +65,15 @@ DATABASES['default']['CONN_MAX_AGE'] = 60
 
 # Production Redis configuration
 CACHES['default']['OPTIONS'].update({
+    'CONNECTION_POOL_CLASS': 'redis.BlockingConnectionPool',
     'CONNECTION_POOL_KWARGS': {
-        'max_connections': 100,
+        # Hard cap per worker process. Cache calls are short, so a few dozen
+        # connections serve many greenlets; under bursts the rest wait up to
+        # `timeout` for one (backpressure) rather than flooding Redis.
+        'max_connections': config('REDIS_MAX_CONNECTIONS', default=32, cast=int),
+        'timeout': config('DJANGO_CACHE_BLOCKING_TIMEOUT', default=2.0, cast=float),
+        'socket_timeout': 2,
+        'socket_connect_timeout': 2,
         'retry_on_timeout': True,
         'socket_keepalive': True,
         'socket_keepalive_options': {},
@@ -108,6 +123,11 @@ SERVER_EMAIL = config('SERVER_EMAIL', default='server@primepass.com')
 # LOGGING CONFIGURATION
 # ==============================================================================
 
+# Request threads only put records on this queue; file/console I/O happens on
+# the listener thread started by backend.log_config.configure_logging.
+_log_queue = queue.Queue(-1)
+
+LOGGING_CONFIG = 'backend.log_config.configure_logging'
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
@@ -135,28 +155,36 @@ LOGGING = {
             'class': 'logging.StreamHandler',
             'formatter': 'json',
         },
+        # Sentry stays attached directly: it needs the caller's scope and
+        # exc_info, which are lost once a record crosses the queue.
         'sentry': {
             'level': 'ERROR',
             'class': 'sentry_sdk.integrations.logging.SentryHandler',
         },
+        'queue': {
+            'class': 'logging.handlers.QueueHandler',
+            'queue': _log_queue,
+            # Drained by the listener into these (see backend.log_config)
+            '.': {'targets': ['file', 'console']},
+        },
     },
     'root': {
-        'handlers': ['console', 'file', 'sentry'],
+        'handlers': ['queue', 'sentry'],
         'level': 'INFO',
     },
     'loggers': {
         'django': {
-            'handlers': ['console', 'file', 'sentry'],
+            'handlers': ['queue', 'sentry'],
             'level': 'INFO',
             'propagate': False,
         },
         'primepass': {
-            'handlers': ['console', 'file', 'sentry'],
+            'handlers': ['queue', 'sentry'],
             'level': 'INFO',
             'propagate': False,
         },
         'celery': {
-            'handlers': ['console', 'file', 'sentry'],
+            'handlers': ['queue', 'sentry'],
             'level': 'INFO',
             'propagate': False,
         },
@@ -167,27 +195,13 @@ LOGGING = {
 # SENTRY CONFIGURATION
 # ==============================================================================
 
+# The SDK is initialised per worker process by backend.sentry_init.init_sentry
+# (gunicorn post_worker_init, Celery worker/beat init signals,
+# backend.asgi, manage.py), not at import time.
 SENTRY_DSN = config('SENTRY_DSN', default='')
-if SENTRY_DSN:
-    sentry_sdk.init(
-        dsn=SENTRY_DSN,
-        integrations=[
-            DjangoIntegration(
-                transaction_style='url',
-                middleware_spans=True,
-                signals_spans=True,
-            ),
-            CeleryIntegration(
-                monitor_beat_tasks=True,
-                propagate_traces=True,
-            ),
-            RedisIntegration(),
-        ],
-        traces_sample_rate=config('SENTRY_TRACES_SAMPLE_RATE', default=0.1, cast=float),
-        send_default_pii=False,
-        environment=config('ENVIRONMENT', default='production'),
-        release=config('RELEASE_VERSION', default='1.0.0'),
-    )
+SENTRY_TRACES_SAMPLE_RATE = config('SENTRY_TRACES_SAMPLE_RATE', default=0.1, cast=float)
+SENTRY_ENVIRONMENT = config('ENVIRONMENT', default='production')
+SENTRY_RELEASE = config('RELEASE_VERSION', default='1.0.0')
 
 # ==============================================================================
 # CORS CONFIGURATION
@@ -196,7 +210,7 @@ if SENTRY_DSN:
 CORS_ALLOW_ALL_ORIGINS = False
 CORS_ALLOWED_ORIGINS = config(
     'CORS_ALLOWED_ORIGINS',
-    cast=lambda v: [s.strip() for s in v.split(',')]
+    cast=_csv
 )
 
 # ==============================================================================
@@ -205,29 +219,21 @@ CORS_ALLOWED_ORIGINS = config(
 
 # Production Celery settings
 CELERY_TASK_ALWAYS_EAGER = False
-CELERY_WORKER_PREFETCH_MULTIPLIER = 1
-CELERY_TASK_ACKS_LATE = True
+# Default child recycling; the bulk worker overrides it on the command line
+# (--max-tasks-per-child=200 --max-memory-per-child=512000) to cap RSS growth.
 CELERY_WORKER_MAX_TASKS_PER_CHILD = 1000
-
-# Task routing
-CELERY_TASK_ROUTES = {
-    'apps.notifications.tasks.*': {'queue': 'notifications'},
-    'apps.events.tasks.*': {'queue': 'events'},
-    'apps.analytics.tasks.*': {'queue': 'analytics'},
-}
+# Skip the remote-control (pidbox) channel and its broker traffic; set to
+# True temporarily when `celery inspect`/`control` is needed.
+CELERY_WORKER_ENABLE_REMOTE_CONTROL = config('CELERY_REMOTE_CONTROL', default=False, cast=bool)
 
 # ==============================================================================
 # PERFORMANCE OPTIMIZATIONS
 # ==============================================================================
 
-# Database optimizations
-DATABASES['default']['OPTIONS'].update({
-    'MAX_CONNS': 20,
-    'OPTIONS': {
-        'MAX_CONNS': 20,
-        'autocommit': True,
-    }
-})
+# Database connection pooling is handled by PgBouncer (transaction mode) plus
+# persistent Django connections; see CONN_MAX_AGE, CONN_HEALTH_CHECKS and
+# DISABLE_SERVER_SIDE_CURSORS above. Size PgBouncer's pool at roughly
+# workers * threads plus some headroom.
 
 # Template caching
 TEMPLATES[0]['OPTIONS']['loaders'] = [
@@ -254,6 +260,8 @@ HEALTH_CHECK = {
 # Production rate limits
 RATELIMIT_ENABLE = True
 RATELIMIT_USE_CACHE = 'default'
+# Behind nginx REMOTE_ADDR is the proxy; it sets X-Real-IP to the peer address
+RATELIMIT_IP_META_KEY = 'HTTP_X_REAL_IP'
 
 # ==============================================================================
 # CUSTOM PRODUCTION SETTINGS
@@ -261,30 +269,52 @@ RATELIMIT_USE_CACHE = 'default'
 
 # Disable browsable API in production
 REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'] = [
-    'djangorestframework_camel_case.render.CamelCaseJSONRenderer',
+    'backend.renderers.OrjsonCamelCaseRenderer',
 ]
 
-# Production-specific middleware
-MIDDLEWARE.insert(1, 'django.middleware.cache.UpdateCacheMiddleware')
-MIDDLEWARE.append('django.middleware.cache.FetchFromCacheMiddleware')
-
-# Cache middleware settings
-CACHE_MIDDLEWARE_ALIAS = 'default'
-CACHE_MIDDLEWARE_SECONDS = 600
-CACHE_MIDDLEWARE_KEY_PREFIX = 'primepass'
+# Responses are cached by nginx/the CDN from their Cache-Control headers
+# rather than in Django. Cacheable views answer revalidation themselves with
+# django.views.decorators.http.condition (see backend.views.prebuilt_schema)
+# instead of ConditionalGetMiddleware hashing every rendered body.
 
 # ==============================================================================
 # BACKUP CONFIGURATION
 # ==============================================================================
 
 # Database backup settings
-DBBACKUP_STORAGE = 'django.core.files.storage.FileSystemStorage'
-DBBACKUP_STORAGE_OPTIONS = {'location': '/var/backups/primepass/'}
+# With a bucket configured, dumps are streamed to S3 as concurrent multipart
+# uploads instead of being written to local disk first.
+DBBACKUP_S3_BUCKET = config('DBBACKUP_S3_BUCKET', default='')
+if DBBACKUP_S3_BUCKET:
+    from boto3.s3.transfer import TransferConfig
+
+    DBBACKUP_STORAGE = 'storages.backends.s3boto3.S3Boto3Storage'
+    DBBACKUP_STORAGE_OPTIONS = {
+        'bucket_name': DBBACKUP_S3_BUCKET,
+        'default_acl': 'private',
+        'transfer_config': TransferConfig(
+            multipart_chunksize=16 * 1024 * 1024,
+            max_concurrency=8,
+            use_threads=True,
+        ),
+    }
+else:
+    DBBACKUP_STORAGE = 'django.core.files.storage.FileSystemStorage'
+    DBBACKUP_STORAGE_OPTIONS = {'location': '/var/backups/primepass/'}
 
 # ==============================================================================
 # ADMIN CONFIGURATION
 # ==============================================================================
 
 # Secure admin
-ADMIN_URL = config('ADMIN_URL', default='admin/')
 ADMIN_FORCE_ALLAUTH = True
+
+# Set ENABLE_ADMIN=False on API workers once a separate admin process (and a
+# proxy route for /admin/ to it) exists; they then skip mounting the admin and
+# admin.autodiscover(), so they don't import every ModelAdmin at boot
+# (ENABLE_ADMIN is read in base).
+if not ENABLE_ADMIN:
+    INSTALLED_APPS = [
+        'django.contrib.admin.apps.SimpleAdminConfig' if app == 'django.contrib.admin' else app
+        for app in INSTALLED_APPS
+    ]
@@ -5,10 +5,14 @@ The `urlpatterns` list routes URLs to views. For more information please see:
     https://docs.djangoproject.com/en/4.2/topics/http/urls/
 """
 
+from pathlib import Path
+
 from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
+from django.views.decorators.cache import cache_control
+from django.views.decorators.vary import vary_on_headers
 from drf_spectacular.views import (
     SpectacularAPIView,
     SpectacularRedocView,
@@ -20,6 +24,8 @@ from rest_framework_simplejwt.views import (
     TokenVerifyView,
 )
 
+from .views import health, prebuilt_schema
+
 # API URL patterns
 api_v1_patterns = [
     # Authentication
@@ -33,39 +39,55 @@ api_v1_patterns = [
     # path('payments/', include('apps.payments.urls')),
     # path('analytics/', include('apps.analytics.urls')),
     
-    # Health check
-    path('health/', include('health_check.urls')),
+    # Health check (cached for probes; /deep/ always runs every check)
+    path('health/', health, name='health'),
+    path('health/deep/', include('health_check.urls')),
 ]
 
+
+# Shared, user-independent responses that nginx/the CDN may cache
+def public_cache(view):
+    return cache_control(public=True, s_maxage=600, max_age=0)(
+        vary_on_headers('Authorization')(view)
+    )
+
+
+# Serve the deploy-time schema file when available
+if not settings.DEBUG and Path(settings.SPECTACULAR_SCHEMA_FILE).is_file():
+    schema_view = prebuilt_schema
+else:
+    schema_view = SpectacularAPIView.as_view()
+
+
 # Main URL patterns
 urlpatterns = [
-    # Admin
-    path('admin/', admin.site.urls),
-    
     # API
     path('api/v1/', include(api_v1_patterns)),
     
     # API Documentation
-    path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
-    path('api/docs/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
-    path('api/redoc/', SpectacularRedocView.as_view(url_name='schema'), name='redoc'),
+    path('api/schema/', public_cache(schema_view), name='schema'),
+    path('api/docs/', public_cache(SpectacularSwaggerView.as_view(url_name='schema')), name='swagger-ui'),
+    path('api/redoc/', public_cache(SpectacularRedocView.as_view(url_name='schema')), name='redoc'),
     
     # Django Allauth
     # path('accounts/', include('allauth.urls')),  # Commented out - allauth not configured
 ]
 
+# Admin (disabled on production API workers, see ENABLE_ADMIN)
+if settings.ENABLE_ADMIN:
+    urlpatterns += [path(settings.ADMIN_URL, admin.site.urls)]
+
 # Development URLs
 if settings.DEBUG:
-    import debug_toolbar
-    
-    urlpatterns += [
-        path('__debug__/', include(debug_toolbar.urls)),
-        path('silk/', include('silk.urls', namespace='silk')),
-    ]
+    if 'debug_toolbar' in settings.INSTALLED_APPS:
+        urlpatterns += [path('__debug__/', include('debug_toolbar.urls'))]
+
+    if 'silk' in settings.INSTALLED_APPS:
+        urlpatterns += [path('silk/', include('silk.urls', namespace='silk'))]
     
-    # Serve media files in development
+    # Serve media files in development; static files are served by
+    # WhiteNoiseMiddleware, which runs before URL resolution
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
-    urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
 
 # Custom error handlers (commented out until core app is created)
 # handler400 = 'apps.core.views.bad_request'
@@ -0,0 +1,82 @@
+"""
+Project-level views for PrimePass project.
+"""
+
+import gzip
+import hashlib
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+
+import orjson
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.cache import add_never_cache_headers, patch_vary_headers
+from django.views.decorators.http import condition
+from health_check.mixins import CheckMixin
+
+
+@lru_cache(maxsize=None)
+def _read_schema(path):
+    """
+    Load the schema once, along with a gzip copy compressed up front and the
+    validators used for conditional requests.
+    """
+    path = Path(path)
+    raw = path.read_bytes()
+    # Weak: the raw and gzip representations share it
+    etag = 'W/"%s"' % hashlib.blake2b(raw, digest_size=16).hexdigest()
+    last_modified = datetime.fromtimestamp(path.stat().st_mtime, tz=timezone.utc)
+    return raw, gzip.compress(raw, compresslevel=9), etag, last_modified
+
+
+def _schema_etag(request):
+    return _read_schema(settings.SPECTACULAR_SCHEMA_FILE)[2]
+
+
+def _schema_last_modified(request):
+    return _read_schema(settings.SPECTACULAR_SCHEMA_FILE)[3]
+
+
+@condition(etag_func=_schema_etag, last_modified_func=_schema_last_modified)
+def prebuilt_schema(request):
+    """
+    Serve the OpenAPI schema generated at deploy time (manage.py spectacular).
+
+    Revalidation (If-None-Match/If-Modified-Since) is answered with a 304
+    before the body is touched.
+    """
+    raw, compressed, _etag, _last_modified = _read_schema(settings.SPECTACULAR_SCHEMA_FILE)
+    if 'gzip' in request.META.get('HTTP_ACCEPT_ENCODING', ''):
+        response = HttpResponse(compressed)
+        response['Content-Encoding'] = 'gzip'
+    else:
+        response = HttpResponse(raw)
+    response['Content-Type'] = 'application/vnd.oai.openapi+json'
+    patch_vary_headers(response, ('Accept-Encoding',))
+    return response
+
+
+# Probe results are reused for this many seconds so frequent liveness/readiness
+# polling doesn't run the disk, memory, DB and cache checks on every hit.
+HEALTH_CACHE_SECONDS = 5
+
+
+@lru_cache(maxsize=1)
+def _health_snapshot(bucket):
+    checks = CheckMixin()
+    status = 500 if checks.errors else 200
+    body = orjson.dumps({
+        str(plugin.identifier()): str(plugin.pretty_status())
+        for plugin in checks.plugins
+    })
+    return status, body
+
+
+def health(request):
+    """Composite health status, cached for HEALTH_CACHE_SECONDS."""
+    status, body = _health_snapshot(int(time.monotonic() // HEALTH_CACHE_SECONDS))
+    response = HttpResponse(body, status=status, content_type='application/json')
+    add_never_cache_headers(response)
+    return response
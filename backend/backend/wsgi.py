@@ -9,7 +9,12 @@ https://docs.djangoproject.com/en/4.2/howto/deployment/wsgi/
 
 import os
 from django.core.wsgi import get_wsgi_application
+from django.urls import get_resolver
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings.production')
 
 application = get_wsgi_application()
+
+# Import the URLconf and build the reverse-lookup tables now (in the gunicorn
+# master when preload_app is on) rather than on each worker's first request.
+get_resolver().reverse_dict
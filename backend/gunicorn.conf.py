@@ -0,0 +1,24 @@
+"""
+Gunicorn configuration for PrimePass project.
+
+Picked up automatically from the working directory; command-line flags
+(e.g. in the Dockerfile) take precedence.
+"""
+
+bind = "0.0.0.0:8000"
+workers = 4
+worker_class = "gevent"
+worker_connections = 1000
+max_requests = 1000
+max_requests_jitter = 100
+timeout = 30
+keepalive = 2
+preload_app = True
+
+
+def post_worker_init(worker):
+    # Runs after the gevent worker has monkey-patched and loaded the app, so
+    # the SDK's transport thread and sockets are cooperative.
+    from backend.sentry_init import init_sentry
+
+    init_sentry()
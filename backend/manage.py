@@ -15,6 +15,10 @@ def main():
             "available on your PYTHONPATH environment variable? Did you "
             "forget to activate a virtual environment?"
         ) from exc
+    # Report failures of production commands (migrate, dbbackup cron, ...);
+    # a no-op unless the settings define SENTRY_DSN.
+    from backend.sentry_init import init_sentry
+    init_sentry()
     execute_from_command_line(sys.argv)
 
 